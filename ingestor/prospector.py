@@ -2,15 +2,38 @@
 Creates the Prospector class for discovering file attributes.
 
 Classes:
+    Prospect
     Prospector
 """
+from dataclasses import dataclass
 from datetime import datetime
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
 
 from xxhash import xxh128
 
+HASH_BLOCK_SIZE: int = 1024 * 1024
+
+
+@dataclass(slots=True)
+class Prospect:
+    """
+    Prospect class holds the information collected about a file by the Prospector. It
+    serializes directly with orjson, without first being converted to a dictionary.
+
+    Attributes:
+        found_at (float): Timestamp, in UTC, of when the file was prospected.
+        name (str): The file that was prospected.
+        hashes (dict[str, str]): Hashes of the file, where the key specifies the type of
+        hash.
+        neighbors (list[str]): Neighboring files.
+    """
+
+    found_at: float
+    name: str
+    hashes: dict[str, str]
+    neighbors: list[str]
+
 
 class Prospector:
     """
@@ -35,25 +58,23 @@ class Prospector:
         """
         self.path: Path = path
 
-    def prospect(self) -> dict[str, Any]:
+    def prospect(self) -> Prospect:
         """
         Collect all the information of the file specified by the path that is used
         elsewhere in apollonia.
 
         Returns:
-            dict[str, Any]: Dictionary of the data collected.
+            Prospect: The data collected.
         """
         filename: str = str(self.path)
         print(f" --: prospecting {filename} :-- ")
 
-        data: dict = {
-            "found_at": datetime.utcnow().timestamp(),
-            "name": filename,
-            "hashes": self.__hashes(),
-            "neighbors": self.__neighbors(),
-        }
-
-        return data
+        return Prospect(
+            found_at=datetime.utcnow().timestamp(),
+            name=filename,
+            hashes=self.__hashes(),
+            neighbors=self.__neighbors(),
+        )
 
     def __hashes(self) -> dict[str, str]:
         """
@@ -66,10 +87,15 @@ class Prospector:
         hash_sha256 = sha256()
         hash_xxh128 = xxh128()
 
-        with self.path.open("rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(byte_block)
-                hash_xxh128.update(byte_block)
+        # Read large blocks straight into one reusable buffer, so hashing is bound by the
+        # hash functions rather than by per-read syscall and allocation overhead.
+        buffer: bytearray = bytearray(HASH_BLOCK_SIZE)
+        view: memoryview = memoryview(buffer)
+        with self.path.open("rb", buffering=0) as f:
+            while size := f.readinto(buffer):
+                block: memoryview = view[:size]
+                hash_sha256.update(block)
+                hash_xxh128.update(block)
 
         return {"sha256": hash_sha256.hexdigest(), "xxh128": hash_xxh128.hexdigest()}
 